@@ -5,62 +5,141 @@ Handles both service account and OAuth authentication for YouTube API access.
 
 from __future__ import annotations
 
+import functools
+import json
 import os
 import pickle
-
-import jsonc  # type: ignore
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
-from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-from googleapiclient.discovery import build  # type: ignore
+import re
+from typing import TYPE_CHECKING, Any
 
 from config import Config
-from youtube_types import YouTubeResource
+
+if TYPE_CHECKING:
+    # Only used in annotations; importing it at runtime would load
+    # googleapiclient.discovery, which the lazy imports below avoid
+    from youtube_types import YouTubeResource
 
 SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
 
+# JSONC support: comments and trailing commas are stripped with these patterns
+# before the text is handed to the (C-accelerated) stdlib JSON parser.
+# String literals are matched first so that e.g. "https://..." is left intact.
+_JSONC_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.S)
+_JSONC_TRAILING_COMMA_RE = re.compile(r'("(?:\\.|[^"\\])*")|,(?=\s*[}\]])')
 
-def get_youtube_service(service_account_file: str) -> YouTubeResource:
+# OAuth token file, and the pickled token file written by older versions, which
+# is migrated to JSON (once) if it's found in the same directory instead
+TOKEN_FILE = 'token.json'
+LEGACY_TOKEN_FILE = 'token.pickle'
+
+# OAuth credentials loaded from token files, keyed by path: (file mtime, credentials)
+_credentials_cache: dict[str, tuple[float, Any]] = {}
+
+# The Google client libraries are imported inside the functions that need them:
+# they're slow to import, and each auth method only needs a subset of them.
+
+
+def build_youtube_service(credentials: Any) -> YouTubeResource:
     """
-    Create and return an authenticated YouTube API service using service account.
+    Build the YouTube API service for the given credentials.
+    
+    The service is not thread-safe (httplib2 connections can't be shared
+    between threads), so multi-threaded callers should build one per thread;
+    the credentials themselves can be shared.
+    """
+    from googleapiclient.discovery import build  # type: ignore
+
+    youtube = build('youtube', 'v3', credentials=credentials)
+    return youtube  # type: ignore[return-value]
+
+
+def get_service_account_credentials(service_account_file: str) -> Any:
+    """
+    Load service account credentials for YouTube API access.
     
     Args:
         service_account_file: Path to the service account JSON key file
         
     Returns:
-        Authenticated YouTube API service
+        Service account credentials
     """
-    credentials = service_account.Credentials.from_service_account_file(
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(
         service_account_file,
         scopes=SCOPES
     )
+
+
+def get_youtube_service(service_account_file: str) -> YouTubeResource:
+    """
+    Create and return an authenticated YouTube API service using service account.
+    
+    Args:
+        service_account_file: Path to the service account JSON key file
+        
+    Returns:
+        Authenticated YouTube API service
+    """
+    credentials = get_service_account_credentials(service_account_file)
     
     # Build and return the YouTube API service
-    youtube = build('youtube', 'v3', credentials=credentials)
-    return youtube  # type: ignore[return-value]
+    return build_youtube_service(credentials)
 
 
-def get_youtube_service_oauth(
+def get_oauth_credentials(
     credentials_file: str, 
-    token_file: str = 'token.pickle'
-) -> YouTubeResource:
+    token_file: str = TOKEN_FILE
+) -> Any:
     """
-    Create and return an authenticated YouTube API service using OAuth.
+    Load OAuth credentials for YouTube API access.
     This requires user login the first time, then saves a token for future use.
     
     Args:
         credentials_file: Path to OAuth client credentials JSON
-        token_file: Path to save/load the authentication token
+        token_file: Path to save/load the authentication token. A path
+            ending in the legacy token.pickle name is migrated to a
+            token.json in the same directory.
         
     Returns:
-        Authenticated YouTube API service
+        OAuth credentials
     """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
     credentials = None
+    needs_save = False
+    legacy_token_file = os.path.join(os.path.dirname(token_file), LEGACY_TOKEN_FILE)
+    if os.path.basename(token_file) == LEGACY_TOKEN_FILE:
+        # Config from an older version: keep the token as JSON alongside it
+        token_file = os.path.join(os.path.dirname(token_file), TOKEN_FILE)
+        print(
+            f"Warning: oauth_token_file points at {legacy_token_file}; using {token_file} "
+            f"instead. Set oauth_token_file to '{TOKEN_FILE}' to silence this warning."
+        )
     
-    # Check if we have saved credentials
+    # Check if we have saved credentials, reusing the in-memory copy if the
+    # token file hasn't changed since we last read it
     if os.path.exists(token_file):
-        with open(token_file, 'rb') as token:
+        mtime = os.path.getmtime(token_file)
+        cached = _credentials_cache.get(token_file)
+        if cached and cached[0] == mtime:
+            credentials = cached[1]
+        else:
+            with open(token_file, 'r', encoding='utf-8') as token:
+                try:
+                    token_info = json.load(token)
+                except ValueError as e:
+                    raise ValueError(f"{token_file} is not a valid JSON token file") from e
+            credentials = Credentials.from_authorized_user_info(token_info, SCOPES)
+            _credentials_cache[token_file] = (mtime, credentials)
+    elif os.path.exists(legacy_token_file):
+        # Token saved by an older version in pickle format: load it this once
+        # and save it to token_file as JSON below, so it's never read again
+        print(f"Migrating {legacy_token_file} to {token_file}...")
+        with open(legacy_token_file, 'rb') as token:
             credentials = pickle.load(token)
+        needs_save = True
     
     # If no valid credentials, let user log in
     if not credentials or not credentials.valid:
@@ -68,53 +147,103 @@ def get_youtube_service_oauth(
             print("Refreshing expired credentials...")
             credentials.refresh(Request())
         else:
+            from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
+
             print("No valid credentials found. Starting OAuth flow...")
             print("A browser window will open for you to log in.")
             flow = InstalledAppFlow.from_client_secrets_file( # type: ignore
                 credentials_file, SCOPES)
             credentials = flow.run_local_server(port=0) # type: ignore
-        
+        needs_save = True
+    
+    if needs_save:
         # Save credentials for next time
-        with open(token_file, 'wb') as token:
-            pickle.dump(credentials, token)
+        with open(token_file, 'w', encoding='utf-8') as token:
+            token.write(credentials.to_json())
+        _credentials_cache[token_file] = (os.path.getmtime(token_file), credentials)
         print("Credentials saved for future use.")
     
+    return credentials
+
+
+def get_youtube_service_oauth(
+    credentials_file: str, 
+    token_file: str = TOKEN_FILE
+) -> YouTubeResource:
+    """
+    Create and return an authenticated YouTube API service using OAuth.
+    This requires user login the first time, then saves a token for future use.
+    
+    Args:
+        credentials_file: Path to OAuth client credentials JSON
+        token_file: Path to save/load the authentication token
+        
+    Returns:
+        Authenticated YouTube API service
+    """
+    credentials = get_oauth_credentials(credentials_file, token_file)
+    
     # Build and return the YouTube API service
-    youtube = build('youtube', 'v3', credentials=credentials)
-    return youtube  # type: ignore[return-value]
+    return build_youtube_service(credentials)
 
 
-def get_authenticated_service(config: Config) -> YouTubeResource:
+def get_authenticated_credentials(config: Config) -> Any:
     """
-    Get authenticated YouTube service based on configuration.
+    Get credentials for the YouTube API based on configuration.
     
     Args:
         config: Configuration dictionary with auth_method specified
         
     Returns:
-        Authenticated YouTube API service
+        Credentials for building a YouTube API service
     """
     auth_method = config.get('auth_method', 'service_account')
     
     if auth_method == 'oauth':
         oauth_file = config.get('oauth_credentials_file') or 'oauth_credentials.json'
-        token_file = config.get('oauth_token_file') or 'token.pickle'
-        return get_youtube_service_oauth(oauth_file, token_file)
+        token_file = config.get('oauth_token_file') or TOKEN_FILE
+        return get_oauth_credentials(oauth_file, token_file)
     elif auth_method == 'service_account':
-        return get_youtube_service(config['service_account_file'])
+        return get_service_account_credentials(config['service_account_file'])
     else:
         raise ValueError(f"Unknown auth_method: {auth_method}. Use 'service_account' or 'oauth'")
 
 
+def get_authenticated_service(config: Config) -> YouTubeResource:
+    """
+    Get authenticated YouTube service based on configuration.
+    
+    Args:
+        config: Configuration dictionary with auth_method specified
+        
+    Returns:
+        Authenticated YouTube API service
+    """
+    return build_youtube_service(get_authenticated_credentials(config))
+
+
 def load_config(config_file: str = 'config.jsonc') -> Config:
     """
     Load configuration from JSONC file (JSON with comments).
-    
+
+    Results are cached per file and reloaded automatically when the file's
+    modification time changes, so long-running processes (e.g. the web server)
+    don't re-parse the config on every request.
+
     Args:
         config_file: Path to configuration file
         
     Returns:
         Configuration dictionary
     """
-    with open(config_file, 'r') as f:
-        return jsonc.load(f)  # type: ignore[return-value]
+    return _load_config_cached(config_file, os.path.getmtime(config_file))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(config_file: str, mtime: float) -> Config:
+    """Parse the config file. `mtime` is only used as part of the cache key."""
+    with open(config_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    text = _JSONC_COMMENT_RE.sub(lambda m: m.group(1) or '', text)
+    text = _JSONC_TRAILING_COMMA_RE.sub(lambda m: m.group(1) or '', text)
+    return json.loads(text)
@@ -1,18 +1,28 @@
-from datetime import datetime, timedelta, tzinfo
-
-import pytz
+import functools
+import os
+from datetime import datetime, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo
 
 # Helper functions to get hold of the current time, but allowing
 # 'current time' to be changed for development.
 
-offset = timedelta(0)
-# For development:
+# For development, set TIME_OFFSET_SECONDS (e.g. 691200 for 8 days) or edit:
 # offset = timedelta(days=8)
+offset = timedelta(seconds=float(os.environ.get('TIME_OFFSET_SECONDS', 0)))
 
 def get_current_time_local(tz: tzinfo) -> datetime:
     """Return the current local time."""
+    if not offset:
+        return datetime.now(tz)
     return datetime.now(tz) + offset
 
 def get_current_time_utc() -> datetime:
     """Return the current UTC time."""
-    return datetime.now(pytz.UTC) + offset
+    if not offset:
+        return datetime.now(timezone.utc)
+    return datetime.now(timezone.utc) + offset
+
+@functools.lru_cache(maxsize=16)
+def get_timezone(name: str) -> ZoneInfo:
+    """Return the timezone with the given IANA name, cached by name."""
+    return ZoneInfo(name)
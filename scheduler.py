@@ -6,40 +6,43 @@ Automatically maintains a buffer of upcoming broadcasts and cleans up old ones.
 
 from __future__ import annotations
 
-import math
+import functools
+import logging
 import sys
-from datetime import datetime, timedelta
-from typing import List
-
-import pytz
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
 
 from auth import get_authenticated_service, load_config
 from config import BroadcastConfig, Config, SchedulingConfig
-from current_time import get_current_time_utc
+from current_time import get_current_time_utc, get_timezone
 from youtube_api import (
-    bind_broadcast_to_stream,
-    create_broadcast,
-    delete_broadcast,
+    bind_broadcasts_batch,
+    create_broadcasts_batch,
+    delete_broadcasts_batch,
     get_broadcast_edit_url,
     get_broadcast_status_summary,
     get_broadcast_watch_url,
-    get_or_create_stream,
+    get_or_create_stream_cached,
     get_video_tags_batch,
-    is_broadcast_old,
-    list_broadcasts,
+    invalidate_stream_cache,
+    iter_broadcasts,
     parse_broadcast_time,
-    update_video_settings,
+    update_video_settings_batch,
 )
 from youtube_types import LiveBroadcast
 
 
-def get_next_service_dates(config: Config, num_weeks: int = 4) -> List[datetime]:
+def get_next_service_dates(
+    config: Config, num_weeks: int = 4, now_utc: datetime | None = None
+) -> List[datetime]:
     """
     Calculate the next N service dates based on configuration.
 
     Args:
         config: Configuration dictionary
         num_weeks: Number of weeks to generate
+        now_utc: Current UTC time (defaults to now)
 
     Returns:
         List of UTC datetime objects for upcoming services.
@@ -55,31 +58,35 @@ def get_next_service_dates(config: Config, num_weeks: int = 4) -> List[datetime]
     hour, minute, second = time_parts[0], time_parts[1], time_parts[2]
 
     # Get timezone (schedule is configured in local wall-clock time)
-    tz_local = pytz.timezone(timezone_str)
+    tz_local = get_timezone(timezone_str)
 
     # Find next occurrence of the day from local wall-clock perspective
-    now_utc = get_current_time_utc()
+    if now_utc is None:
+        now_utc = get_current_time_utc()
     now_local = now_utc.astimezone(tz_local)
 
     days_ahead = day_of_week - now_local.weekday()
     if days_ahead <= 0:  # Target day already happened this week
         days_ahead += 7
 
-    service_dates_utc: list[datetime] = []
-    for week in range(num_weeks):
-        next_date_local = now_local + timedelta(days=days_ahead + (week * 7))
-        service_datetime_local = tz_local.localize(
-            datetime(
-                next_date_local.year,
-                next_date_local.month,
-                next_date_local.day,
-                hour,
-                minute,
-                second,
-            )
-        )
-        service_datetime_utc = service_datetime_local.astimezone(pytz.UTC)
-        service_dates_utc.append(service_datetime_utc)
+    # Build the first service time once, then step it a week at a time.
+    # Arithmetic on zoneinfo-aware datetimes works in wall-clock time, so the
+    # local time stays fixed across DST changes.
+    first_date_local = now_local + timedelta(days=days_ahead)
+    first_service_local = datetime(
+        first_date_local.year,
+        first_date_local.month,
+        first_date_local.day,
+        hour,
+        minute,
+        second,
+        tzinfo=tz_local,
+    )
+
+    service_dates_utc: list[datetime] = [
+        (first_service_local + timedelta(weeks=week)).astimezone(timezone.utc)
+        for week in range(num_weeks)
+    ]
 
     return service_dates_utc
 
@@ -99,6 +106,41 @@ def format_broadcast_title(template: str, service_date_local: datetime) -> str:
     return template.format(date=date_str)
 
 
+def compile_title_template(template: str) -> Callable[[datetime], str]:
+    """
+    Prepare a title template for repeated use.
+
+    Templates whose only placeholder is a single {date} are split once into
+    a prefix and suffix, avoiding str.format's parsing on every call.
+    Anything else falls back to format_broadcast_title.
+
+    Args:
+        template: Title template with {date} placeholder
+
+    Returns:
+        Function taking a local service date and returning the title
+    """
+    prefix, sep, suffix = template.partition("{date}")
+    if sep and not any(c in prefix + suffix for c in "{}"):
+        return lambda service_date_local: (
+            prefix + service_date_local.strftime("%Y-%m-%d") + suffix
+        )
+    return functools.partial(format_broadcast_title, template)
+
+
+def broadcast_date_key(time_utc: datetime) -> int:
+    """
+    Build the key used to match broadcasts to service dates.
+
+    Args:
+        time_utc: Timezone-aware broadcast time
+
+    Returns:
+        Whole minutes since the Unix epoch
+    """
+    return int(time_utc.timestamp()) // 60
+
+
 def maintain_broadcasts(dry_run: bool = False) -> None:
     """
     Main function to maintain broadcasts: create upcoming ones and delete old ones.
@@ -116,20 +158,28 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
     # Get or create the reusable stream FIRST, so we can filter broadcasts by it
     print("Setting up reusable stream...")
     stream_key: str = config["stream_key"]
-    stream_id: str = get_or_create_stream(youtube, stream_key)
+    stream_id: str = get_or_create_stream_cached(youtube, stream_key)
     print(f"Stream ID: {stream_id}")
 
+    # Read the clock once so that creation and cleanup agree on "now"
+    now_utc = get_current_time_utc()
+
     print(f"\nFetching existing broadcasts for stream {stream_id}...")
-    existing_broadcasts = list_broadcasts(
-        youtube, max_results=math.inf, stream_id=stream_id
-    )
-    print(f"Found {len(existing_broadcasts)} existing broadcasts bound to this stream")
 
-    # Show status breakdown
-    status_counts: dict[str, int] = {}
-    for broadcast in existing_broadcasts:
+    # Parse each broadcast's scheduled time and status once, as the pages
+    # stream in; everything below works from these cached values.
+    # Time is None for broadcasts without a parseable scheduled time.
+    parsed_broadcasts: list[tuple[LiveBroadcast, datetime | None, str]] = []
+    status_counts: Counter[str] = Counter()
+    for broadcast in iter_broadcasts(youtube, stream_id=stream_id):
+        try:
+            scheduled_time_utc: datetime | None = parse_broadcast_time(broadcast)
+        except Exception:
+            scheduled_time_utc = None
         status = get_broadcast_status_summary(broadcast)
-        status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts[status] += 1
+        parsed_broadcasts.append((broadcast, scheduled_time_utc, status))
+    print(f"Found {len(parsed_broadcasts)} existing broadcasts bound to this stream")
 
     print("\nBroadcast Status Summary:")
     for status in sorted(status_counts.keys()):
@@ -140,29 +190,26 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
     broadcasts_config: BroadcastConfig = config["broadcasts"]
     buffer_weeks: int = scheduling["buffer_weeks_ahead"]
     timezone_str: str = scheduling["timezone"]
-    timezone_local = pytz.timezone(timezone_str)
-    required_dates_utc: List[datetime] = get_next_service_dates(config, buffer_weeks)
+    timezone_local = get_timezone(timezone_str)
+    required_dates_utc: List[datetime] = get_next_service_dates(config, buffer_weeks, now_utc)
     print(f"\nRequired upcoming broadcasts ({buffer_weeks} weeks):")
     for required_date_utc in required_dates_utc:
         required_date_local = required_date_utc.astimezone(timezone_local)
         print(f"  - {required_date_local.strftime('%Y-%m-%d %H:%M %Z')}")
 
     # Check which broadcasts already exist
-    existing_dates: set[str] = set()
+    existing_dates: set[int] = set()
     skipped_count = 0
-    for broadcast in existing_broadcasts:
-        try:
-            scheduled_time_utc = parse_broadcast_time(broadcast)
+    for broadcast, scheduled_time_utc, status in parsed_broadcasts:
+        if scheduled_time_utc is not None:
             scheduled_time_local = scheduled_time_utc.astimezone(timezone_local)
 
-            # Round to the same UTC time format for comparison
-            date_key = scheduled_time_utc.strftime("%Y-%m-%d %H:%M")
-            print(
-                f"Existing broadcast: {scheduled_time_local} - {get_broadcast_status_summary(broadcast)}"
-            )
+            # Key on the UTC time to the minute for comparison
+            date_key = broadcast_date_key(scheduled_time_utc)
+            print(f"Existing broadcast: {scheduled_time_local} - {status}")
             
             existing_dates.add(date_key)
-        except Exception:
+        else:
             broadcast_id = broadcast.get("id", "")
             print(
                 f"Warning: Could not parse scheduled time for broadcast ID {broadcast_id}"
@@ -170,7 +217,6 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
             print(f" URL: {get_broadcast_edit_url(broadcast_id)}")
             # This is normal for completed/past broadcasts that may not have scheduledStartTime
             skipped_count += 1
-            continue
 
     if skipped_count > 0:
         print(
@@ -182,79 +228,84 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
     created_count: int = 0
     num_spare_broadcasts: int = scheduling["num_spare_broadcasts"]
 
+    format_title = compile_title_template(broadcasts_config["title_template"])
+
+    # Broadcasts to create, as (title, scheduled time in UTC, kind for error messages)
+    to_create: list[tuple[str, datetime, str]] = []
     for service_date_utc in required_dates_utc:
-        date_key: str = service_date_utc.strftime("%Y-%m-%d %H:%M")
+        date_key = broadcast_date_key(service_date_utc)
         service_date_local = service_date_utc.astimezone(timezone_local)
         if date_key not in existing_dates:
             # Create main broadcast
-            title: str = format_broadcast_title(
-                broadcasts_config["title_template"], service_date_local
-            )
-
-            if dry_run:
-                print(
-                    f"  [DRY RUN] Would create: {title} at {service_date_local.strftime('%Y-%m-%d %H:%M %Z')}"
-                )
-            else:
-                print(f"  Creating: {title}")
-                try:
-                    broadcast = create_broadcast(
-                        youtube,
-                        title,
-                        service_date_utc,
-                        broadcasts_config["description"],
-                        config,
-                    )
-                    # Bind to the reusable stream
-                    broadcast_id: str = broadcast.get("id", "")
-                    bind_broadcast_to_stream(youtube, broadcast_id, stream_id)
-
-                    # Update video settings (category, privacy, stats) after binding
-                    update_video_settings(youtube, broadcast_id, config)
-
-                    url: str = get_broadcast_watch_url(broadcast_id)
-                    print(f"    Created: {url}")
-                    created_count += 1
-                except Exception as e:
-                    print(f"    ERROR: Failed to create broadcast: {e}")
+            title: str = format_title(service_date_local)
+            to_create.append((title, service_date_utc, "broadcast"))
 
             # Create spare broadcasts (1 minute apart each)
             for spare_num in range(1, num_spare_broadcasts + 1):
                 spare_date_utc = service_date_utc + timedelta(minutes=spare_num)
-                spare_date_local = spare_date_utc.astimezone(timezone_local)
                 spare_title = f"{title} - SPARE {spare_num}"
-
-                if dry_run:
-                    print(
-                        f"  [DRY RUN] Would create: {spare_title} at {spare_date_local.strftime('%Y-%m-%d %H:%M %Z')}"
-                    )
-                else:
-                    print(f"  Creating: {spare_title}")
-                    try:
-                        spare_broadcast = create_broadcast(
-                            youtube,
-                            spare_title,
-                            spare_date_utc,
-                            broadcasts_config["description"],
-                            config,
-                        )
-                        # Bind to the reusable stream
-                        spare_broadcast_id: str = spare_broadcast.get("id", "")
-                        bind_broadcast_to_stream(youtube, spare_broadcast_id, stream_id)
-
-                        # Update video settings (category, privacy, stats) after binding
-                        update_video_settings(youtube, spare_broadcast_id, config)
-
-                        spare_url: str = get_broadcast_watch_url(spare_broadcast_id)
-                        print(f"    Created: {spare_url}")
-                        created_count += 1
-                    except Exception as e:
-                        print(f"    ERROR: Failed to create spare broadcast: {e}")
+                to_create.append((spare_title, spare_date_utc, "spare broadcast"))
         else:
             print(
                 f"  Already exists: {service_date_local.strftime('%Y-%m-%d %H:%M %Z')}"
             )
 
+    if dry_run:
+        for title, date_utc, _ in to_create:
+            date_local = date_utc.astimezone(timezone_local)
+            print(
+                f"  [DRY RUN] Would create: {title} at {date_local.strftime('%Y-%m-%d %H:%M %Z')}"
+            )
+    elif to_create:
+        # Each step is sent for all broadcasts at once as batched HTTP
+        # requests, rather than several sequential round-trips per broadcast
+        for title, _, _ in to_create:
+            print(f"  Creating: {title}")
+        results = create_broadcasts_batch(
+            youtube,
+            [(title, date_utc) for title, date_utc, _ in to_create],
+            broadcasts_config["description"],
+            config,
+        )
+
+        new_titles: dict[str, str] = {}  # broadcast ID -> title
+        kinds: dict[str, str] = {}  # broadcast ID -> kind
+        for (title, _, kind), result in zip(to_create, results):
+            if isinstance(result, Exception):
+                print(f"    ERROR: Failed to create {kind} {title}: {result}")
+            else:
+                broadcast_id: str = result.get("id", "")
+                new_titles[broadcast_id] = title
+                kinds[broadcast_id] = kind
+
+        # Bind to the reusable stream
+        bind_errors = bind_broadcasts_batch(youtube, list(new_titles), stream_id)
+        if bind_errors:
+            # The cached stream ID may be stale (e.g. the stream was deleted or
+            # recreated), so look the stream up again and retry with a new ID
+            invalidate_stream_cache(stream_key)
+            new_stream_id = get_or_create_stream_cached(youtube, stream_key)
+            if new_stream_id != stream_id:
+                print(f"  Stream ID changed to {new_stream_id}, retrying {len(bind_errors)} bind(s)...")
+                stream_id = new_stream_id
+                bind_errors = bind_broadcasts_batch(youtube, list(bind_errors), stream_id)
+        created_titles: dict[str, str] = {}  # broadcast ID -> title
+        for broadcast_id, title in new_titles.items():
+            error = bind_errors.get(broadcast_id)
+            if error is not None:
+                print(f"    ERROR: Failed to create {kinds[broadcast_id]} {title}: {error}")
+            else:
+                print(f"    Created: {title}: {get_broadcast_watch_url(broadcast_id)}")
+                created_titles[broadcast_id] = title
+                created_count += 1
+
+        # Update video settings (category, privacy, stats) after binding, batched
+        if created_titles:
+            print("  Updating video settings...")
+            settings_errors = update_video_settings_batch(youtube, created_titles, config)
+            for broadcast_id, error in settings_errors.items():
+                print(f"    Warning: Could not update video settings for {broadcast_id}: {error}")
+
     print(f"\nCreated {created_count} new broadcast(s)")
 
     # Delete old broadcasts (only those with auto_delete tag)
@@ -264,10 +315,12 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
     skipped_no_tag: int = 0
 
     # First, identify broadcasts that are old enough to delete
-    old_broadcasts: list[LiveBroadcast] = []
-    for broadcast in existing_broadcasts:
-        if is_broadcast_old(broadcast, delete_threshold):
-            old_broadcasts.append(broadcast)
+    delete_cutoff_utc = now_utc - timedelta(hours=delete_threshold)
+    old_broadcasts: list[tuple[LiveBroadcast, str]] = [
+        (broadcast, status)
+        for broadcast, scheduled_time_utc, status in parsed_broadcasts
+        if scheduled_time_utc is not None and scheduled_time_utc < delete_cutoff_utc
+    ]
     
     if not old_broadcasts:
         print("No old broadcasts found to clean up")
@@ -275,11 +328,12 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
         print(f"Found {len(old_broadcasts)} old broadcast(s) to check for auto_delete tag")
         
         # Batch fetch video data to check tags efficiently (up to 50 IDs per request)
-        broadcast_ids = [b.get('id', '') for b in old_broadcasts if b.get('id')]
+        broadcast_ids = [b.get('id', '') for b, _ in old_broadcasts if b.get('id')]
         video_tags_map = get_video_tags_batch(youtube, broadcast_ids)
         
         # Now process deletions with tag information
-        for broadcast in old_broadcasts:
+        to_delete: dict[str, str] = {}  # broadcast ID -> title
+        for broadcast, status_summary in old_broadcasts:
             broadcast_id: str = broadcast.get("id", "")
             
             # Check if video has the auto_delete tag
@@ -291,7 +345,6 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
 
             snippet = broadcast.get("snippet", {})
             title: str = snippet.get("title", "Untitled")
-            status_summary: str = get_broadcast_status_summary(broadcast)
 
             if dry_run:
                 print(
@@ -299,14 +352,17 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
                 )
             else:
                 print(f"  Deleting: {title} - {status_summary}")
-                try:
-                    # Commented out for safety during development.
-                    # Copilot, do not uncomment this until we are absolutely satisfied
-                    # that everything is safe.
-                    delete_broadcast(youtube, broadcast_id)
+                to_delete[broadcast_id] = title
+
+        if to_delete:
+            # Send all deletions in as few batched HTTP requests as possible
+            delete_errors = delete_broadcasts_batch(youtube, list(to_delete))
+            for broadcast_id, title in to_delete.items():
+                error = delete_errors.get(broadcast_id)
+                if error is None:
                     deleted_count += 1
-                except Exception as e:
-                    print(f"    ERROR: Failed to delete: {e}")
+                else:
+                    print(f"    ERROR: Failed to delete {title}: {error}")
 
     print(f"\nDeleted {deleted_count} old broadcast(s)")
     if skipped_no_tag > 0:
@@ -319,6 +375,9 @@ def maintain_broadcasts(dry_run: bool = False) -> None:
 if __name__ == "__main__":
     dry_run = "--dry-run" in sys.argv or "-n" in sys.argv
 
+    # Show warnings from youtube_api inline with the progress output
+    logging.basicConfig(format="    %(levelname)s: %(message)s")
+
     if dry_run:
         print("=" * 60)
         print("DRY RUN MODE - No changes will be made")
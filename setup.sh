@@ -7,7 +7,7 @@ echo ""
 
 # Check if Python 3 is installed
 if ! command -v python3 &> /dev/null; then
-    echo "ERROR: Python 3 is not installed. Please install Python 3.8 or later."
+    echo "ERROR: Python 3 is not installed. Please install Python 3.9 or later."
     exit 1
 fi
 
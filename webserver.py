@@ -6,26 +6,29 @@ Simple Flask app to display upcoming broadcast links for Zoom hosts.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+import os
+import threading
+import time
+from datetime import datetime, timedelta, tzinfo
 from math import inf
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import Any, TypedDict, cast
 
-import pytz
 from flask import Flask, Response, current_app, render_template
 
-from auth import get_authenticated_service, load_config
-from current_time import get_current_time_utc
+from auth import build_youtube_service, get_authenticated_credentials, load_config
+from config import Config
+from current_time import get_current_time_utc, get_timezone
 from youtube_api import (
     get_broadcast_embed_url,
     get_broadcast_watch_url,
-    get_or_create_stream,
+    get_or_create_stream_cached,
     is_broadcast_live,
     list_broadcasts,
     parse_broadcast_time,
     sort_broadcasts_by_youtube_priority,
 )
-from youtube_types import LiveBroadcast
+from youtube_types import LiveBroadcast, YouTubeResource
 
 # Set up logging
 logging.basicConfig(
@@ -34,11 +37,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Development mode enables the debugger/reloader and template auto-reloading
+DEVELOPMENT = os.environ.get('FLASK_ENV') == 'development'
+
 app = Flask(__name__)
+app.config['TEMPLATES_AUTO_RELOAD'] = DEVELOPMENT
+app.jinja_env.auto_reload = DEVELOPMENT
 _default_static_dir = Path(__file__).with_name('static')
 STATIC_DIR = Path(app.static_folder) if app.static_folder else _default_static_dir
 SERVICE_WORKER_PATH = STATIC_DIR / 'service-worker.js'
-SERVICE_WORKER_CONTENT = SERVICE_WORKER_PATH.read_text(encoding='utf-8')
+SERVICE_WORKER_CONTENT = SERVICE_WORKER_PATH.read_bytes()
+# Kept immutable: each response builds its own Headers object from these pairs
+SERVICE_WORKER_HEADERS = (
+    ('Content-Type', 'text/javascript; charset=utf-8'),
+    ('Cache-Control', 'no-cache, no-store, must-revalidate'),
+    ('Service-Worker-Allowed', '/'),
+)
 
 # Jinja2 filter functions with proper type annotations
 def _youtube_watch_url_filter(broadcast_id: str) -> str:
@@ -55,6 +69,65 @@ def _youtube_embed_url_filter(broadcast_id: str) -> str:
 app.jinja_env.filters['youtube_watch_url'] = _youtube_watch_url_filter  # type: ignore[index]
 app.jinja_env.filters['youtube_embed_url'] = _youtube_embed_url_filter  # type: ignore[index]
 
+# Credentials and stream ID, cached across requests and shared by all threads.
+# Entries expire after SERVICE_CACHE_TTL_SECONDS so credentials get rebuilt
+# periodically rather than living for the lifetime of the process.
+SERVICE_CACHE_TTL_SECONDS = 30 * 60
+_service_cache: dict[str, tuple[Any, str, float]] = {}
+_service_cache_lock = threading.Lock()
+
+# The YouTube service itself sits on an httplib2 connection, which isn't
+# thread-safe, so each request thread builds its own from the shared
+# credentials: stream key -> (youtube service, created_at of its credentials)
+_thread_services = threading.local()
+
+
+def get_cached_service(config: Config) -> tuple[YouTubeResource, str]:
+    """
+    Get an authenticated YouTube service and the reusable stream ID,
+    reusing previously-loaded credentials and stream ID if they haven't
+    expired. The returned service belongs to the calling thread.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Tuple of (youtube service, stream ID)
+    """
+    stream_key: str = config['stream_key']
+    services: dict[str, tuple[YouTubeResource, float]] | None = getattr(_thread_services, 'services', None)
+    if services is None:
+        services = _thread_services.services = {}
+    with _service_cache_lock:
+        cached = _service_cache.get(stream_key)
+        if cached and time.monotonic() - cached[2] < SERVICE_CACHE_TTL_SECONDS:
+            credentials, stream_id, created_at = cached
+        else:
+            auth_method = config.get('auth_method', 'service_account')
+            logger.info(f"Authenticating with YouTube API using {auth_method}...")
+            credentials = get_authenticated_credentials(config)
+            created_at = time.monotonic()
+            youtube = build_youtube_service(credentials)
+            services[stream_key] = (youtube, created_at)
+
+            # Get or create the reusable stream to determine which broadcasts to show
+            logger.info("Setting up reusable stream...")
+            stream_id = get_or_create_stream_cached(youtube, stream_key)
+            _service_cache[stream_key] = (credentials, stream_id, created_at)
+
+    # Build this thread's service if it doesn't have one for these credentials
+    service = services.get(stream_key)
+    if service is None or service[1] != created_at:
+        service = (build_youtube_service(credentials), created_at)
+        services[stream_key] = service
+    return service[0], stream_id
+
+
+# Outside development, load and compile the page template once up front
+# rather than letting Jinja check it on every request
+_INDEX_TEMPLATE = 'index.html' if DEVELOPMENT else app.jinja_env.get_template('index.html')
+
+
 class BroadcastInfo(TypedDict):
     """Processed broadcast information for display in web interface."""
     display_datestring: str
@@ -66,7 +139,8 @@ class BroadcastInfo(TypedDict):
 
 def broadcast_to_display_info(
     broadcast: LiveBroadcast,
-    display_tz: pytz.BaseTzInfo,
+    scheduled_time_utc: datetime,
+    display_tz: tzinfo,
     now_utc: datetime
 ) -> BroadcastInfo:
     """
@@ -74,13 +148,13 @@ def broadcast_to_display_info(
     
     Args:
         broadcast: LiveBroadcast object from YouTube API
+        scheduled_time_utc: The broadcast's already-parsed scheduled time (UTC)
         display_tz: Timezone to display the time in
         now_utc: Current time in UTC for comparison
         
     Returns:
         BroadcastInfo dictionary ready for template rendering
     """
-    scheduled_time_utc = parse_broadcast_time(broadcast)
     snippet = broadcast.get('snippet', {})
     broadcast_id = broadcast.get('id', '')
     is_live = is_broadcast_live(broadcast)
@@ -103,14 +177,7 @@ def index() -> str | tuple[str, int]:
     try:
         logger.info("Loading configuration...")
         config = load_config()
-        auth_method = config.get('auth_method', 'service_account')
-        logger.info(f"Authenticating with YouTube API using {auth_method}...")
-        youtube = get_authenticated_service(config)
-        
-        # Get or create the reusable stream to determine which broadcasts to show
-        logger.info("Setting up reusable stream...")
-        stream_key: str = config['stream_key']
-        stream_id: str = get_or_create_stream(youtube, stream_key)
+        youtube, stream_id = get_cached_service(config)
         logger.info(f"Stream ID: {stream_id}")
         
         # Get all broadcasts bound to our stream
@@ -120,7 +187,7 @@ def index() -> str | tuple[str, int]:
         
         # Get current time and display timezone
         now_utc = get_current_time_utc()
-        display_tz = pytz.timezone(config['scheduling']['timezone'])
+        display_tz = get_timezone(config['scheduling']['timezone'])
         
         # Sort broadcasts using YouTube's priority algorithm
         streamable, historical = sort_broadcasts_by_youtube_priority(all_broadcasts, now_utc)
@@ -137,7 +204,8 @@ def index() -> str | tuple[str, int]:
         streamable_list: list[BroadcastInfo] = []
         for broadcast in streamable:
             try:
-                info = broadcast_to_display_info(broadcast, display_tz, now_utc)
+                scheduled_time_utc = parse_broadcast_time(broadcast)
+                info = broadcast_to_display_info(broadcast, scheduled_time_utc, display_tz, now_utc)
                 streamable_list.append(info)
             except Exception as e:
                 logger.error(f"Error processing streamable broadcast: {e}")
@@ -152,7 +220,7 @@ def index() -> str | tuple[str, int]:
                 
                 # Only include recent historical broadcasts
                 if scheduled_time_utc >= recent_boundary_utc:
-                    info = broadcast_to_display_info(broadcast, display_tz, now_utc)
+                    info = broadcast_to_display_info(broadcast, scheduled_time_utc, display_tz, now_utc)
                     historical_list.append(info)
             except Exception as e:
                 logger.error(f"Error processing historical broadcast: {e}")
@@ -166,7 +234,7 @@ def index() -> str | tuple[str, int]:
         page_title = web_server_config.get('page_title', 'Broadcast Schedule')
         
         return render_template(
-            template_name_or_list='index.html',
+            template_name_or_list=_INDEX_TEMPLATE,
             streamable_broadcasts=streamable_list,
             historical_broadcasts=historical_list,
             historical_days=historical_days,
@@ -203,16 +271,10 @@ def index() -> str | tuple[str, int]:
 @app.route('/service-worker.js')
 def service_worker() -> Response:
     """Serve the service worker from the app root for full-scope control."""
-    response: Response = cast(
+    return cast(
         Response,
-        current_app.response_class(
-        SERVICE_WORKER_CONTENT,
-        mimetype='text/javascript'
-        )
+        current_app.response_class(SERVICE_WORKER_CONTENT, headers=SERVICE_WORKER_HEADERS)
     )
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response.headers['Service-Worker-Allowed'] = '/'
-    return response
 
 
 def run_server() -> None:
@@ -223,18 +285,20 @@ def run_server() -> None:
         server_config = config['web_server']
         
         # Use PORT env variable for Cloud Run, fallback to config
-        import os
         port = int(os.environ.get('PORT', server_config['port']))
         host = os.environ.get('HOST', server_config['host'])
         
         logger.info("Starting web server...")
         logger.info(f"Access at: http://{host}:{port}/")
         
-        app.run(
-            host=host,
-            port=port,
-            debug=True  # Enable debug mode for better error messages
-        )
+        if DEVELOPMENT:
+            # Flask's dev server, with the debugger and reloader
+            app.run(host=host, port=port, debug=True)
+        else:
+            # Threaded production WSGI server; requests spend most of their time
+            # blocked on YouTube API calls, so threads serve users concurrently
+            from waitress import serve  # type: ignore
+            serve(app, host=host, port=port, threads=8)
     except Exception as e:
         logger.error(f"Failed to start server: {e}", exc_info=True)
         raise
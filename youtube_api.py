@@ -6,36 +6,99 @@ streams, and video settings.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import random
+import threading
 import time
-from datetime import datetime
-from typing import Callable, List, TypeVar
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import AbstractSet, Any, Callable, Iterator, List, TypeVar
 
-import pytz
 from dateutil import parser as date_parser
 from googleapiclient.errors import HttpError
 
-from config import Config
+from config import BroadcastConfig, Config
 from current_time import get_current_time_utc
 from youtube_types import LiveBroadcast, YouTubeResource
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+UTC = timezone.utc
+
+# HTTP statuses retried by default (rate limiting/quota), and those worth
+# retrying for idempotent reads (transient server errors)
+DEFAULT_RETRY_STATUSES = frozenset({403})
+SERVER_ERROR_STATUSES = frozenset(range(500, 600))
+
+# Partial-response field masks: only request the properties we actually read.
+# Extend these if new code needs more of a resource.
+BROADCAST_LIST_FIELDS = (
+    'items(id,snippet(title,scheduledStartTime),'
+    'status(lifeCycleStatus,recordingStatus),contentDetails/boundStreamId),'
+    'nextPageToken'
+)
+VIDEO_TAGS_FIELDS = 'items(id,snippet/tags)'
+STREAM_KEY_FIELDS = 'items(id,cdn/ingestionInfo/streamName)'
+
+# In-process caches for lookups that rarely change, so long-running callers
+# can skip repeat API calls. Values are stored with the time they were fetched.
+LOOKUP_CACHE_TTL_SECONDS = 5 * 60
+_stream_id_cache: dict[str, tuple[str, float]] = {}  # stream key -> stream ID
+_video_tags_cache: dict[str, tuple[list[str], float]] = {}  # video ID -> tags
+_lookup_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: dict[str, tuple[T, float]], key: str) -> T | None:
+    """Return the cached value for key, or None if missing or expired."""
+    with _lookup_cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] >= LOOKUP_CACHE_TTL_SECONDS:
+            del cache[key]
+            return None
+        return entry[0]
+
+
+def _cache_put(cache: dict[str, tuple[T, float]], key: str, value: T) -> None:
+    """Store value in the cache under key."""
+    with _lookup_cache_lock:
+        cache[key] = (value, time.monotonic())
+
+
+def _retry_statuses(retry_statuses: AbstractSet[int] | None) -> AbstractSet[int]:
+    """Resolve a `retry_statuses` argument; None means DEFAULT_RETRY_STATUSES."""
+    return DEFAULT_RETRY_STATUSES if retry_statuses is None else retry_statuses
+
+
+def _retry_delay(delay_seconds: float, jitter_seconds: float) -> float:
+    """Add up to `jitter_seconds` of random jitter to a backoff delay."""
+    return delay_seconds + random.uniform(0, jitter_seconds)
+
 
 def execute_with_retries(
     operation: Callable[[], T],
     operation_name: str,
-    retry_statuses: set[int] | None = None,
+    retry_statuses: AbstractSet[int] | None = None,
     max_attempts: int = 4,
     initial_delay_seconds: float = 1.5,
     backoff_multiplier: float = 2.0,
+    jitter_seconds: float = 1.0,
 ) -> T:
     """
     Execute an API operation with retry + exponential backoff.
 
     Defaults to retrying only HTTP 403, but can be reused elsewhere by passing
-    different `retry_statuses`.
+    different `retry_statuses` (e.g. `SERVER_ERROR_STATUSES`), or an empty set
+    to disable retries. Each delay has up to `jitter_seconds` of random jitter
+    added, so concurrent callers don't all retry in lockstep.
     """
-    statuses = retry_statuses or {403}
+    statuses = _retry_statuses(retry_statuses)
     delay_seconds = initial_delay_seconds
     last_error: Exception | None = None
 
@@ -49,22 +112,105 @@ def execute_with_retries(
             if not should_retry:
                 raise
 
-            print(
-                f"    Warning: {operation_name} failed with HTTP {status}. "
-                f"Retrying in {delay_seconds:.1f}s... ({attempt}/{max_attempts})"
+            wait_seconds = _retry_delay(delay_seconds, jitter_seconds)
+            logger.warning(
+                f"{operation_name} failed with HTTP {status}. "
+                f"Retrying in {wait_seconds:.1f}s... ({attempt}/{max_attempts})"
             )
-            time.sleep(delay_seconds)
+            time.sleep(wait_seconds)
             delay_seconds *= backoff_multiplier
 
     raise RuntimeError(f"{operation_name} failed after retries: {last_error}")
 
 
+def execute_batch_with_retries(
+    youtube: YouTubeResource,
+    requests: dict[str, Callable[[], Any]],
+    operation_name: str,
+    retry_statuses: AbstractSet[int] | None = None,
+    max_attempts: int = 4,
+    initial_delay_seconds: float = 1.5,
+    backoff_multiplier: float = 2.0,
+    jitter_seconds: float = 1.0,
+    no_retry: Callable[[Exception], bool] | None = None,
+) -> tuple[dict[str, Any], dict[str, Exception]]:
+    """
+    Execute several API requests as batched HTTP requests, retrying the
+    individual requests that fail with a retryable status.
+
+    The batched counterpart to `execute_with_retries`. Requests are given as
+    factories keyed by an ID, since a fresh request is built for each attempt.
+    Retry statuses and backoff (including jitter) work as they do there; pass
+    an empty `retry_statuses` to disable retries (e.g. for inserts).
+    Errors for which `no_retry` returns True are never retried, whatever
+    their status.
+
+    Returns:
+        Tuple of (responses, errors): dictionaries mapping request ID to the
+        response of each request that succeeded, and to the final error of
+        each request that failed.
+    """
+    statuses = _retry_statuses(retry_statuses)
+    delay_seconds = initial_delay_seconds
+    responses: dict[str, Any] = {}
+    errors: dict[str, Exception] = {}
+    pending = list(requests)
+    batch_size = 50
+
+    for attempt in range(1, max_attempts + 1):
+        attempt_errors: dict[str, Exception] = {}
+
+        def on_response(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                attempt_errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        for i in range(0, len(pending), batch_size):
+            batch = youtube.new_batch_http_request(callback=on_response)
+            for request_id in pending[i:i + batch_size]:
+                batch.add(requests[request_id](), request_id=request_id)
+            try:
+                batch.execute()
+            except Exception as e:
+                # The whole batch request failed; report it against every ID in it
+                for request_id in pending[i:i + batch_size]:
+                    attempt_errors.setdefault(request_id, e)
+
+        retryable = [
+            request_id for request_id, e in attempt_errors.items()
+            if isinstance(e, HttpError) and getattr(e.resp, "status", None) in statuses
+            and not (no_retry and no_retry(e))
+        ]
+        if not retryable or attempt == max_attempts:
+            errors.update(attempt_errors)
+            break
+
+        for request_id, e in attempt_errors.items():
+            if request_id not in retryable:
+                errors[request_id] = e
+        wait_seconds = _retry_delay(delay_seconds, jitter_seconds)
+        logger.warning(
+            f"{operation_name} failed for {len(retryable)} request(s). "
+            f"Retrying in {wait_seconds:.1f}s... ({attempt}/{max_attempts})"
+        )
+        time.sleep(wait_seconds)
+        delay_seconds *= backoff_multiplier
+        pending = retryable
+
+    return responses, errors
+
+
 def get_video_tags_batch(
     youtube: YouTubeResource,
     video_ids: list[str]
 ) -> dict[str, list[str]]:
     """
-    Fetch video tags for multiple videos in batch (up to 50 per API call).
+    Fetch video tags for multiple videos in batch (up to 50 per API call,
+    with the API calls themselves sent as batched HTTP requests).
+    
+    Results are cached for LOOKUP_CACHE_TTL_SECONDS; only IDs without a
+    cached entry are fetched.
     
     Args:
         youtube: Authenticated YouTube API service
@@ -74,30 +220,95 @@ def get_video_tags_batch(
         Dictionary mapping video ID to list of tags
     """
     video_tags_map: dict[str, list[str]] = {}
+    missing_ids: list[str] = []
+    for video_id in video_ids:
+        cached_tags = _cache_get(_video_tags_cache, video_id)
+        if cached_tags is None:
+            missing_ids.append(video_id)
+        else:
+            video_tags_map[video_id] = cached_tags
+    video_ids = missing_ids
+    videos_api = youtube.videos()
     
-    # Fetch video data in batches of 50
-    batch_size = 50
-    for i in range(0, len(video_ids), batch_size):
-        batch_ids = video_ids[i:i + batch_size]
-        
-        try:
-            videos_response = youtube.videos().list(
+    def on_response(request_id: str, response: dict[str, Any], exception: Exception | None) -> None:
+        if exception is not None:
+            logger.warning(f"Failed to fetch video tags for batch: {exception}")
+            return
+        for video in response.get('items', []):
+            video_id = video.get('id', '')
+            snippet = video.get('snippet', {})
+            tags = snippet.get('tags', [])
+            if video_id:
+                video_tags_map[video_id] = tags
+                _cache_put(_video_tags_cache, video_id, tags)
+    
+    # Fetch video data in lists of 50 IDs, sending up to 50 of those lists
+    # together in one batched HTTP request rather than one round-trip each
+    ids_per_list = 50
+    lists_per_batch = 50
+    id_lists = [video_ids[i:i + ids_per_list] for i in range(0, len(video_ids), ids_per_list)]
+    for i in range(0, len(id_lists), lists_per_batch):
+        batch = youtube.new_batch_http_request(callback=on_response)
+        for batch_ids in id_lists[i:i + lists_per_batch]:
+            batch.add(videos_api.list(
                 part='snippet',
-                id=batch_ids
-            ).execute()
-            
-            for video in videos_response.get('items', []):
-                video_id = video.get('id', '')
-                snippet = video.get('snippet', {})
-                tags = snippet.get('tags', [])
-                if video_id:
-                    video_tags_map[video_id] = tags
+                id=batch_ids,
+                fields=VIDEO_TAGS_FIELDS
+            ))
+        try:
+            batch.execute()
         except Exception as e:
-            print(f"Warning: Failed to fetch video tags for batch: {e}")
+            logger.warning(f"Failed to fetch video tags for batch: {e}")
     
     return video_tags_map
 
 
+def iter_broadcasts(
+    youtube: YouTubeResource,
+    stream_id: str | None = None,
+    per_page: int = 50
+) -> Iterator[LiveBroadcast]:
+    """
+    Iterate over live broadcasts for the authenticated channel, fetching
+    further pages only as the caller consumes them.
+    
+    Args:
+        youtube: Authenticated YouTube API service
+        stream_id: Optional stream ID to filter broadcasts by. Only broadcasts
+                  bound to this stream will be yielded.
+        per_page: Number of broadcasts to request per page (API limit is 50)
+        
+    Yields:
+        Broadcast dictionaries
+    """
+    # Note: Cannot use mine=True with broadcastStatus parameter
+    # This will return broadcasts from all channels the authenticated user can manage
+    broadcasts_api = youtube.liveBroadcasts()
+    request = broadcasts_api.list(
+        part='snippet,status,contentDetails',
+        broadcastStatus='all',
+        maxResults=per_page,
+        fields=BROADCAST_LIST_FIELDS
+    )
+    
+    while request:
+        page_request = request
+        response = execute_with_retries(
+            lambda: page_request.execute(),
+            operation_name="liveBroadcasts.list",
+            retry_statuses=SERVER_ERROR_STATUSES,
+        )
+        
+        for item in response.get('items', []):
+            # Filter by stream_id if provided
+            if stream_id and item.get('contentDetails', {}).get('boundStreamId') != stream_id:
+                continue
+            yield item
+        
+        # Get next page if available
+        request = broadcasts_api.list_next(request, response)
+
+
 def list_broadcasts(
     youtube: YouTubeResource,
     max_results: int | float = 50,
@@ -116,43 +327,65 @@ def list_broadcasts(
     Returns:
         List of broadcast dictionaries
     """
-    broadcasts: List[LiveBroadcast] = []
-    # Note: Cannot use mine=True with broadcastStatus parameter
-    # This will return broadcasts from all channels the authenticated user can manage
-    
-    fetch_all = max_results == float('inf')
+    if max_results == float('inf'):
+        return list(iter_broadcasts(youtube, stream_id))
     
-    # API limit is 50 per request
-    per_page = 50 if fetch_all else min(int(max_results), 50)
-    
-    request = youtube.liveBroadcasts().list(
-        part='snippet,status,contentDetails',
-        broadcastStatus='all',
-        maxResults=per_page
-    )
+    # API limit is 50 per request. islice stops before fetching pages we don't need.
+    # When filtering by stream, some items on each page will be discarded, so
+    # always ask for full pages to avoid extra round-trips.
+    per_page = 50 if stream_id else min(int(max_results), 50)
+    return list(islice(iter_broadcasts(youtube, stream_id, per_page), int(max_results)))
+
+
+def _broadcast_insert_body(
+    title: str,
+    scheduled_start_time_utc: datetime,
+    description: str,
+    config: Config
+) -> dict[str, Any]:
+    """Build the liveBroadcasts.insert body for a new broadcast."""
+    broadcast_config = config['broadcasts']
     
-    while request:
-        response = request.execute()
-        items = response.get('items', [])
-        
-        # Filter by stream_id if provided
-        if stream_id:
-            items = [
-                item for item in items
-                if item.get('contentDetails', {}).get('boundStreamId') == stream_id
-            ]
-        
-        broadcasts.extend(items)
-        
-        # Stop if we've reached the desired number
-        if not fetch_all and len(broadcasts) >= max_results:
-            broadcasts = broadcasts[:int(max_results)]
-            break
-        
-        # Get next page if available
-        request = youtube.liveBroadcasts().list_next(request, response)
+    if scheduled_start_time_utc.tzinfo is None:
+        raise ValueError("scheduled_start_time_utc must be timezone-aware")
+
+    # Enforce UTC as internal/API boundary format
+    scheduled_start_time_utc = scheduled_start_time_utc.astimezone(UTC)
+
+    # Format the scheduled start time as ISO 8601
+    start_time_iso = scheduled_start_time_utc.isoformat()
     
-    return broadcasts
+    return {
+        'snippet': {
+            'title': title,
+            'description': description,
+            'scheduledStartTime': start_time_iso,
+            'categoryId': broadcast_config['category_id'],
+            'tags': ['auto_created', 'auto_delete'],  # Automation tags for identification
+        },
+        'status': {
+            'privacyStatus': broadcast_config['privacy_status'],
+            'selfDeclaredMadeForKids': False,
+        },
+        'contentDetails': {
+            # Standard settings
+            'enableAutoStart': broadcast_config['enable_auto_start'],
+            'enableAutoStop': broadcast_config['enable_auto_stop'],
+            'enableDvr': broadcast_config['enable_dvr'],
+            'enableEmbed': broadcast_config['enable_embed'],
+            
+            # Disable chat, reactions, and interactive features
+            'enableClosedCaptions': False,
+            'recordFromStart': True,
+            'startWithSlate': False,
+            'latencyPreference': 'normal',
+            
+            # Monitor stream
+            'monitorStream': {
+                'enableMonitorStream': False,
+            },
+        }
+    }
 
 
 def create_broadcast(
@@ -175,51 +408,10 @@ def create_broadcast(
     Returns:
         Created broadcast object
     """
-    broadcast_config = config['broadcasts']
-    
-    if scheduled_start_time_utc.tzinfo is None:
-        raise ValueError("scheduled_start_time_utc must be timezone-aware")
-
-    # Enforce UTC as internal/API boundary format
-    scheduled_start_time_utc = scheduled_start_time_utc.astimezone(pytz.UTC)
-
-    # Format the scheduled start time as ISO 8601
-    start_time_iso = scheduled_start_time_utc.isoformat()
-    
     # Create the broadcast
     broadcast_response = youtube.liveBroadcasts().insert(
         part='snippet,status,contentDetails',
-        body={
-            'snippet': {
-                'title': title,
-                'description': description,
-                'scheduledStartTime': start_time_iso,
-                'categoryId': broadcast_config['category_id'],
-                'tags': ['auto_created', 'auto_delete'],  # Automation tags for identification  # type: ignore[typeddict-item]
-            },
-            'status': {
-                'privacyStatus': broadcast_config['privacy_status'],
-                'selfDeclaredMadeForKids': False,
-            },
-            'contentDetails': {
-                # Standard settings
-                'enableAutoStart': broadcast_config['enable_auto_start'],
-                'enableAutoStop': broadcast_config['enable_auto_stop'],
-                'enableDvr': broadcast_config['enable_dvr'],
-                'enableEmbed': broadcast_config['enable_embed'],
-                
-                # Disable chat, reactions, and interactive features
-                'enableClosedCaptions': False,  # type: ignore[typeddict-item]
-                'recordFromStart': True,  # type: ignore[typeddict-item]
-                'startWithSlate': False,  # type: ignore[typeddict-item]
-                'latencyPreference': 'normal',  # type: ignore[typeddict-item]
-                
-                # Monitor stream
-                'monitorStream': {  # type: ignore[typeddict-item]
-                    'enableMonitorStream': False,
-                },
-            }
-        }
+        body=_broadcast_insert_body(title, scheduled_start_time_utc, description, config),  # type: ignore[arg-type]
     ).execute()
     
     # Note: Video settings (category, stats, chat) are updated AFTER binding
@@ -252,86 +444,252 @@ def bind_broadcast_to_stream(
     ).execute()
 
 
+def create_broadcasts_batch(
+    youtube: YouTubeResource,
+    broadcasts: list[tuple[str, datetime]],
+    description: str,
+    config: Config
+) -> list[LiveBroadcast | Exception]:
+    """
+    Create several broadcasts, as create_broadcast does for one, sending the
+    inserts together as batched HTTP requests.
+    
+    Inserts are not retried, as a retry after an ambiguous failure could
+    create a duplicate broadcast.
+    
+    Args:
+        youtube: Authenticated YouTube API service
+        broadcasts: (title, scheduled start time in UTC) for each broadcast
+        description: Broadcast description
+        config: Configuration dictionary with broadcast settings
+        
+    Returns:
+        For each requested broadcast, in order: the created broadcast object,
+        or the error if it could not be created
+    """
+    broadcasts_api = youtube.liveBroadcasts()
+    bodies = {
+        str(i): _broadcast_insert_body(title, start_time_utc, description, config)
+        for i, (title, start_time_utc) in enumerate(broadcasts)
+    }
+    responses, errors = execute_batch_with_retries(
+        youtube,
+        {
+            request_id: (
+                lambda body=body: broadcasts_api.insert(
+                    part='snippet,status,contentDetails',
+                    body=body,  # type: ignore[arg-type]
+                )
+            )
+            for request_id, body in bodies.items()
+        },
+        operation_name="liveBroadcasts.insert",
+        retry_statuses=frozenset(),
+    )
+    return [
+        responses[request_id] if request_id in responses else errors[request_id]
+        for request_id in bodies
+    ]
+
+
+def bind_broadcasts_batch(
+    youtube: YouTubeResource,
+    broadcast_ids: list[str],
+    stream_id: str
+) -> dict[str, Exception]:
+    """
+    Bind several broadcasts to an existing stream, as bind_broadcast_to_stream
+    does for one, sending the requests together as batched HTTP requests.
+    
+    Args:
+        youtube: Authenticated YouTube API service
+        broadcast_ids: IDs of the broadcasts
+        stream_id: ID of the stream to bind
+        
+    Returns:
+        Dictionary mapping broadcast ID to the error for each failed bind.
+        Broadcasts that were bound successfully are not included.
+    """
+    broadcasts_api = youtube.liveBroadcasts()
+    _, errors = execute_batch_with_retries(
+        youtube,
+        {
+            broadcast_id: (
+                lambda broadcast_id=broadcast_id: broadcasts_api.bind(
+                    part='id,snippet,status',
+                    id=broadcast_id,
+                    streamId=stream_id
+                )
+            )
+            for broadcast_id in broadcast_ids
+        },
+        operation_name="liveBroadcasts.bind",
+    )
+    return errors
+
+
+# videos.update parts for the full settings update, and the fallback used if
+# the API rejects liveStreamingDetails (chat) for the broadcast's current state
+VIDEO_SETTINGS_PARTS = 'snippet,status,liveStreamingDetails'
+VIDEO_SETTINGS_FALLBACK_PARTS = 'snippet,status'
+
+
+def _is_chat_setting_rejection(error: Exception) -> bool:
+    """
+    Check whether a videos.update error looks like the API rejecting the
+    liveStreamingDetails (chat) part of the update.
+    
+    Only used to avoid spending the 403 retry budget on such errors; the
+    fallback without chat doesn't depend on recognising them.
+    """
+    if not isinstance(error, HttpError) or getattr(error.resp, 'status', None) not in (400, 403):
+        return False
+    details = getattr(error, 'error_details', None)
+    if isinstance(details, list):
+        for detail in details:
+            if isinstance(detail, dict) and any(
+                'liveStreamingDetails' in str(detail.get(field, ''))
+                for field in ('location', 'message')
+            ):
+                return True
+    return 'liveStreamingDetails' in str(getattr(error, 'reason', ''))
+
+
+def _video_settings_body(
+    broadcast_id: str,
+    title: str,
+    broadcast_config: BroadcastConfig,
+    disable_chat: bool = True
+) -> dict[str, Any]:
+    """
+    Build the videos.update body for the video settings: snippet/status, plus
+    liveStreamingDetails to disable chat if `disable_chat` is set.
+    """
+    language = broadcast_config.get('language', 'en-GB')
+    body: dict[str, Any] = {
+        'id': broadcast_id,
+        'snippet': {
+            'categoryId': broadcast_config['category_id'],
+            'title': title,  # Required field
+            'tags': ['auto_created', 'auto_delete'],  # Ensure tags are set on video
+            'defaultLanguage': language,  # Video/title language
+            'defaultAudioLanguage': language,  # Stream audio language
+        },
+        'status': {
+            'privacyStatus': broadcast_config['privacy_status'],
+            'selfDeclaredMadeForKids': False,
+            'madeForKids': False,
+            'publicStatsViewable': not broadcast_config.get('hide_view_count', False),
+            'embeddable': broadcast_config.get('enable_embed', True),  # Allow embedding
+        },
+    }
+    if disable_chat:
+        body['liveStreamingDetails'] = {
+            'enableChat': False,
+        }
+    return body
+
+
 def update_video_settings(
     youtube: YouTubeResource,
     broadcast_id: str,
+    title: str,
     config: Config
 ) -> None:
     """
     Update video settings after broadcast is created and bound.
     This sets category, stats visibility, embedding, language, and attempts to disable chat.
     
+    The single-broadcast form of update_video_settings_batch; failures are
+    logged rather than returned.
+    
+    Args:
+        youtube: Authenticated YouTube API service
+        broadcast_id: ID of the broadcast (same as video ID)
+        title: The broadcast's title (the update must include it)
+        config: Configuration dictionary with broadcast settings
+    """
+    error = update_video_settings_batch(youtube, {broadcast_id: title}, config).get(broadcast_id)
+    if error is None:
+        return
+    if isinstance(error, HttpError) and getattr(error.resp, 'status', None) == 404:
+        logger.warning(f"Video {broadcast_id} not found yet, settings will be set when it becomes available")
+    else:
+        logger.warning(f"Could not update video settings: {error}")
+
+
+def update_video_settings_batch(
+    youtube: YouTubeResource,
+    titles: dict[str, str],
+    config: Config
+) -> dict[str, Exception]:
+    """
+    Update video settings for several broadcasts after they are created and
+    bound. This sets category, stats visibility, embedding, language, and
+    attempts to disable chat.
+    
     Note: Comments cannot be disabled via the API and must be done manually
     in YouTube Studio if needed.
     
+    The updates are sent as batched HTTP requests rather than one round-trip each.
+    
     Args:
         youtube: Authenticated YouTube API service
-        broadcast_id: ID of the broadcast (same as video ID)
+        titles: Dictionary mapping broadcast ID (same as video ID) to its title
         config: Configuration dictionary with broadcast settings
+        
+    Returns:
+        Dictionary mapping broadcast ID to the error for each broadcast whose
+        settings could not be updated. Successful updates are not included.
     """
     broadcast_config = config['broadcasts']
+    videos_api = youtube.videos()
     
-    try:
-        # First, get the current video to ensure it exists
-        video_response = execute_with_retries(
-            lambda: youtube.videos().list(
-                part='snippet,status',
-                id=broadcast_id
-            ).execute(),
-            operation_name=f"videos.list({broadcast_id})",
-        )
-        
-        if not video_response.get('items'):
-            print(f"    Warning: Video {broadcast_id} not found yet, settings will be set when it becomes available")
-            return
-        
-        # Update the video with correct category and settings
-        language = broadcast_config.get('language', 'en-GB')
-        execute_with_retries(
-            lambda: youtube.videos().update(
-                part='snippet,status',
-                body={
-                    'id': broadcast_id,
-                    'snippet': {
-                        'categoryId': broadcast_config['category_id'],
-                        'title': video_response['items'][0]['snippet']['title'],  # type: ignore[index, typeddict-item] - Required field
-                        'tags': ['auto_created', 'auto_delete'],  # type: ignore[typeddict-item] - Ensure tags are set on video
-                        'defaultLanguage': language,  # type: ignore[typeddict-item] - Video/title language
-                        'defaultAudioLanguage': language,  # type: ignore[typeddict-item] - Stream audio language
-                    },
-                    'status': {
-                        'privacyStatus': broadcast_config['privacy_status'],
-                        'selfDeclaredMadeForKids': False,  # type: ignore[typeddict-item]
-                        'madeForKids': False,  # type: ignore[typeddict-item]
-                        'publicStatsViewable': not broadcast_config.get('hide_view_count', False),  # type: ignore[typeddict-item]
-                        'embeddable': broadcast_config.get('enable_embed', True),  # type: ignore[typeddict-item] - Allow embedding
-                    },
-                }
-            ).execute(),
-            operation_name=f"videos.update(snippet/status, {broadcast_id})",
-        )
-        
-        # Try to update live streaming settings (chat)
-        # Note: This may not work for all broadcast states
-        try:
-            execute_with_retries(
-                lambda: youtube.videos().update(
-                    part='liveStreamingDetails',
-                    body={
-                        'id': broadcast_id,
-                        'liveStreamingDetails': {  # type: ignore[typeddict-item]
-                            'enableChat': False,  # type: ignore[typeddict-item]
-                        }
-                    }
-                ).execute(),
-                operation_name=f"videos.update(liveStreamingDetails, {broadcast_id})",
+    # Update the videos with correct category and settings, and disable chat,
+    # in a single request each
+    _, update_errors = execute_batch_with_retries(
+        youtube,
+        {
+            broadcast_id: (
+                lambda broadcast_id=broadcast_id, title=title: videos_api.update(
+                    part=VIDEO_SETTINGS_PARTS,
+                    body=_video_settings_body(broadcast_id, title, broadcast_config),  # type: ignore[arg-type]
+                )
             )
-        except Exception as e:
-            # Chat settings may not be available for all broadcasts
-            print(f"    Note: Could not disable chat via API (this is normal): {e}")
-            
-    except Exception as e:
-        print(f"    Warning: Could not update video settings: {e}")
+            for broadcast_id, title in titles.items()
+        },
+        operation_name=f"videos.update({VIDEO_SETTINGS_PARTS})",
+        no_retry=_is_chat_setting_rejection,
+    )
+    
+    # Chat settings may not be available for all broadcast states;
+    # retry the failures without them (errors from that retry are reported)
+    retry_ids = [
+        broadcast_id for broadcast_id, e in update_errors.items()
+        if not (isinstance(e, HttpError) and getattr(e.resp, 'status', None) == 404)
+    ]
+    for broadcast_id in retry_ids:
+        logger.debug(f"Could not disable chat for {broadcast_id} via API (this is normal): {update_errors[broadcast_id]}")
+    _, fallback_errors = execute_batch_with_retries(
+        youtube,
+        {
+            broadcast_id: (
+                lambda broadcast_id=broadcast_id: videos_api.update(
+                    part=VIDEO_SETTINGS_FALLBACK_PARTS,
+                    body=_video_settings_body(broadcast_id, titles[broadcast_id], broadcast_config, disable_chat=False),  # type: ignore[arg-type]
+                )
+            )
+            for broadcast_id in retry_ids
+        },
+        operation_name=f"videos.update({VIDEO_SETTINGS_FALLBACK_PARTS})",
+    )
+    
+    errors = {
+        broadcast_id: e for broadcast_id, e in update_errors.items()
+        if broadcast_id not in retry_ids
+    }
+    errors.update(fallback_errors)
+    return errors
 
 
 def delete_broadcast(youtube: YouTubeResource, broadcast_id: str) -> None:
@@ -345,6 +703,34 @@ def delete_broadcast(youtube: YouTubeResource, broadcast_id: str) -> None:
     youtube.liveBroadcasts().delete(id=broadcast_id).execute()
 
 
+def delete_broadcasts_batch(
+    youtube: YouTubeResource,
+    broadcast_ids: list[str]
+) -> dict[str, Exception]:
+    """
+    Delete multiple YouTube live broadcasts using batched HTTP requests.
+    
+    Args:
+        youtube: Authenticated YouTube API service
+        broadcast_ids: IDs of the broadcasts to delete
+        
+    Returns:
+        Dictionary mapping broadcast ID to the error for each failed deletion.
+        Broadcasts that were deleted successfully are not included.
+    """
+    broadcasts_api = youtube.liveBroadcasts()
+    _, errors = execute_batch_with_retries(
+        youtube,
+        {
+            broadcast_id: lambda broadcast_id=broadcast_id: broadcasts_api.delete(id=broadcast_id)
+            for broadcast_id in broadcast_ids
+        },
+        operation_name="liveBroadcasts.delete",
+        retry_statuses=frozenset(),
+    )
+    return errors
+
+
 def get_or_create_stream(
     youtube: YouTubeResource, 
     stream_key: str,
@@ -361,41 +747,35 @@ def get_or_create_stream(
     Returns:
         Stream ID
     """
-    # List existing streams with retry logic for transient errors
-    max_retries = 3
-    retry_delay = 1  # seconds
-    streams_response = None
+    cached_id = _cache_get(_stream_id_cache, stream_key)
+    if cached_id is not None:
+        return cached_id
     
-    for attempt in range(max_retries):
-        try:
-            streams_response = youtube.liveStreams().list(
-                part='id,snippet,cdn',
-                mine=True,
-                maxResults=50
-            ).execute()
-            break  # Success, exit retry loop
-        except HttpError as e:
-            if e.resp.status >= 500 and attempt < max_retries - 1:
-                # Server error (5xx) - retry with exponential backoff
-                print(f"YouTube API returned {e.resp.status} error. Retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-            else:
-                # Client error (4xx) or final retry - raise the error
-                raise
-    
-    if streams_response is None:
-        raise RuntimeError("Failed to list streams after retries")
+    # List existing streams, retrying transient server (5xx) errors
+    streams_api = youtube.liveStreams()
+    streams_response = execute_with_retries(
+        lambda: streams_api.list(
+            part='id,snippet,cdn',
+            mine=True,
+            maxResults=50,
+            fields=STREAM_KEY_FIELDS
+        ).execute(),
+        operation_name="liveStreams.list",
+        retry_statuses=SERVER_ERROR_STATUSES,
+        max_attempts=3,
+        initial_delay_seconds=1.0,
+    )
     
     # Look for a stream with matching key
     for stream in streams_response.get('items', []):
         if stream.get('cdn', {}).get('ingestionInfo', {}).get('streamName') == stream_key:
             stream_id = stream.get('id')
             if stream_id:
+                _cache_put(_stream_id_cache, stream_key, stream_id)
                 return stream_id
     
     # If no stream found, create one
-    stream_response = youtube.liveStreams().insert(
+    stream_response = streams_api.insert(
         part='snippet,cdn',
         body={
             'snippet': {
@@ -415,8 +795,100 @@ def get_or_create_stream(
     stream_id = stream_response.get('id')
     if not stream_id:
         raise ValueError("Failed to create stream - no ID returned")
+    _cache_put(_stream_id_cache, stream_key, stream_id)
     return stream_id
 
+# How long a stream ID persisted to disk is trusted before looking it up again
+STREAM_ID_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+def _stream_exists(youtube: YouTubeResource, stream_id: str) -> bool:
+    """Check that a stream with the given ID still exists."""
+    streams_api = youtube.liveStreams()
+    response = execute_with_retries(
+        lambda: streams_api.list(part='id', id=stream_id).execute(),
+        operation_name=f"liveStreams.list({stream_id})",
+        retry_statuses=SERVER_ERROR_STATUSES,
+        max_attempts=3,
+        initial_delay_seconds=1.0,
+    )
+    return bool(response.get('items'))
+
+
+def _stream_id_cache_path(stream_key: str, cache_dir: str | Path) -> Path:
+    """Path of the file get_or_create_stream_cached keeps stream_key's ID in."""
+    key_hash = hashlib.sha1(stream_key.encode()).hexdigest()[:8]
+    return Path(cache_dir) / f'.stream_id_{key_hash}.json'
+
+
+def invalidate_stream_cache(stream_key: str, cache_dir: str | Path = '.') -> None:
+    """
+    Forget the cached stream ID for stream_key, both in memory and on disk,
+    e.g. if the stream was deleted or recreated.
+    
+    Args:
+        stream_key: The stream key whose ID to forget
+        cache_dir: Directory get_or_create_stream_cached keeps the cache file in
+    """
+    with _lookup_cache_lock:
+        _stream_id_cache.pop(stream_key, None)
+    try:
+        _stream_id_cache_path(stream_key, cache_dir).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove stream ID cache for {stream_key}: {e}")
+
+
+def get_or_create_stream_cached(
+    youtube: YouTubeResource,
+    stream_key: str,
+    cache_dir: str | Path = '.'
+) -> str:
+    """
+    Like get_or_create_stream, but remembers the stream ID in a small file
+    so repeated runs can skip the liveStreams.list API call.
+    
+    Once the file is older than STREAM_ID_CACHE_MAX_AGE_SECONDS, the cached ID
+    is checked with a cheap ID-only lookup; if the stream no longer exists,
+    the cache is dropped and the stream is looked up (or created) afresh.
+    
+    Args:
+        youtube: Authenticated YouTube API service
+        stream_key: The stream key to use/find
+        cache_dir: Directory to keep the cache file in
+        
+    Returns:
+        Stream ID
+    """
+    cache_path = _stream_id_cache_path(stream_key, cache_dir)
+    
+    cached_id: str | None = None
+    try:
+        cached = json.loads(cache_path.read_text(encoding='utf-8'))
+        cached_id = cached['id']
+        if time.time() - cached['saved_at'] < STREAM_ID_CACHE_MAX_AGE_SECONDS:
+            return cached_id
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or unreadable cache file: fall through to a fresh lookup
+        pass
+    
+    if cached_id is not None and _stream_exists(youtube, cached_id):
+        stream_id = cached_id
+    else:
+        if cached_id is not None:
+            # The stream was deleted (or recreated with a new ID)
+            invalidate_stream_cache(stream_key, cache_dir)
+        stream_id = get_or_create_stream(youtube, stream_key)
+    try:
+        cache_path.write_text(
+            json.dumps({'id': stream_id, 'saved_at': time.time()}), encoding='utf-8'
+        )
+    except OSError as e:
+        logger.warning(f"Could not save stream ID cache {cache_path}: {e}")
+    return stream_id
+
+
 def get_broadcast_edit_url(broadcast_id: str) -> str:
     """
     Get the YouTube edit URL for a broadcast.
@@ -474,11 +946,15 @@ def parse_broadcast_time(broadcast: LiveBroadcast) -> datetime:
     if not time_str:
         raise ValueError("Broadcast has no scheduled start time")
     
-    scheduled_time = date_parser.isoparse(time_str)
+    try:
+        # Fast path: YouTube returns RFC 3339 timestamps like "2025-01-05T10:00:00Z"
+        scheduled_time = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+    except ValueError:
+        scheduled_time = date_parser.isoparse(time_str)
     if scheduled_time.tzinfo is None:
         # YouTube should provide timezone-aware values, but default to UTC defensively
-        return scheduled_time.replace(tzinfo=pytz.UTC)
-    return scheduled_time.astimezone(pytz.UTC)
+        return scheduled_time.replace(tzinfo=UTC)
+    return scheduled_time.astimezone(UTC)
 
 
 def is_broadcast_old(broadcast: LiveBroadcast, hours_threshold: int) -> bool:
@@ -492,13 +968,8 @@ def is_broadcast_old(broadcast: LiveBroadcast, hours_threshold: int) -> bool:
     Returns:
         True if broadcast is old
     """
-    scheduled_time = parse_broadcast_time(broadcast)
-    now = get_current_time_utc()
-
-    age = now - scheduled_time
-    age_hours = age.total_seconds() / 3600
-    
-    return age_hours > hours_threshold
+    cutoff = get_current_time_utc() - timedelta(hours=hours_threshold)
+    return parse_broadcast_time(broadcast) < cutoff
 
 
 def get_broadcast_lifecycle_status(broadcast: LiveBroadcast) -> str:
@@ -542,6 +1013,29 @@ def is_broadcast_live(broadcast: LiveBroadcast) -> bool:
     return get_broadcast_lifecycle_status(broadcast) == 'live'
 
 
+# Status summaries for specific (lifecycle, recording) combinations, checked
+# before the per-lifecycle defaults below
+_STATUS_SUMMARIES = {
+    ('complete', 'recorded'): '✅ Complete (Recorded)',
+    ('ready', 'notRecording'): '📅 Scheduled (Ready)',
+}
+_LIFECYCLE_SUMMARIES = {
+    'live': '🔴 LIVE NOW',
+    'complete': '✅ Complete',
+    'created': '📅 Scheduled (Not Ready)',
+    'testing': '🧪 Testing',
+    'revoked': '❌ Cancelled',
+}
+
+# YouTube's stream selection priority (lower number = higher priority)
+_LIFECYCLE_PRIORITY = {
+    'live': 0,      # Currently streaming - highest priority
+    'ready': 1,     # Ready to stream
+    'testing': 2,   # Testing mode
+    'created': 3,   # Just created
+}
+
+
 def get_broadcast_status_summary(broadcast: LiveBroadcast) -> str:
     """
     Get a human-readable summary of the broadcast status.
@@ -555,23 +1049,35 @@ def get_broadcast_status_summary(broadcast: LiveBroadcast) -> str:
     lifecycle = get_broadcast_lifecycle_status(broadcast)
     recording = get_broadcast_recording_status(broadcast)
     
-    if lifecycle == 'live':
-        return '🔴 LIVE NOW'
-    elif lifecycle == 'complete':
-        if recording == 'recorded':
-            return '✅ Complete (Recorded)'
-        else:
-            return '✅ Complete'
-    elif lifecycle == 'ready' and recording == 'notRecording':
-        return '📅 Scheduled (Ready)'
-    elif lifecycle == 'created':
-        return '📅 Scheduled (Not Ready)'
-    elif lifecycle == 'testing':
-        return '🧪 Testing'
-    elif lifecycle == 'revoked':
-        return '❌ Cancelled'
-    else:
-        return f'❓ {lifecycle}/{recording}'
+    return (
+        _STATUS_SUMMARIES.get((lifecycle, recording))
+        or _LIFECYCLE_SUMMARIES.get(lifecycle)
+        or f'❓ {lifecycle}/{recording}'
+    )
+
+
+def _extract_sort_arrays(
+    broadcasts: List[LiveBroadcast]
+) -> tuple[List[str], List[float | None]]:
+    """
+    Pull the fields needed for sorting out of the broadcasts in one pass.
+    
+    Args:
+        broadcasts: List of broadcast objects from YouTube API
+        
+    Returns:
+        Parallel lists of (lifecycle statuses, scheduled times as epoch
+        seconds), where the time is None if it couldn't be parsed
+    """
+    lifecycles: List[str] = []
+    times: List[float | None] = []
+    for broadcast in broadcasts:
+        lifecycles.append(get_broadcast_lifecycle_status(broadcast))
+        try:
+            times.append(parse_broadcast_time(broadcast).timestamp())
+        except Exception:
+            times.append(None)
+    return lifecycles, times
 
 
 def sort_broadcasts_by_youtube_priority(
@@ -601,56 +1107,40 @@ def sort_broadcasts_by_youtube_priority(
     if current_time is None:
         current_time = get_current_time_utc()
     
-    # Separate into streamable vs historical
-    streamable: list[LiveBroadcast] = []
-    historical: list[LiveBroadcast] = []
+    now = current_time.timestamp()
+    lifecycles, times = _extract_sort_arrays(broadcasts)
     
-    for broadcast in broadcasts:
-        lifecycle = get_broadcast_lifecycle_status(broadcast)
-        
+    # Separate into streamable vs historical, sorting indices into the
+    # parallel arrays rather than the broadcast dicts themselves
+    streamable_indices: list[int] = []
+    historical_indices: list[int] = []
+    for i, lifecycle in enumerate(lifecycles):
         # Historical broadcasts (already used or cancelled)
-        if lifecycle in ['complete', 'revoked']:
-            historical.append(broadcast)
+        if lifecycle in ('complete', 'revoked'):
+            historical_indices.append(i)
         else:
-            # Streamable broadcasts (can still receive stream)
-            streamable.append(broadcast)
+            streamable_indices.append(i)
     
-    # Sort streamable broadcasts by YouTube's priority
-    def streamable_sort_key(broadcast: LiveBroadcast) -> tuple[int, float]:
-        lifecycle = get_broadcast_lifecycle_status(broadcast)
-        
-        # Priority order (lower number = higher priority)
-        lifecycle_priority = {
-            'live': 0,      # Currently streaming - highest priority
-            'ready': 1,     # Ready to stream
-            'testing': 2,   # Testing mode
-            'created': 3,   # Just created
-        }
-        priority = lifecycle_priority.get(lifecycle, 99)
-        
-        # For broadcasts with same priority, sort by time distance from NOW
-        try:
-            scheduled_time = parse_broadcast_time(broadcast)
-            # Calculate absolute time difference in seconds
-            time_diff = abs((scheduled_time - current_time).total_seconds())
-        except Exception:
+    def streamable_sort_key(i: int) -> tuple[int, float]:
+        # Streamable broadcasts (can still receive stream), sorted by
+        # YouTube's priority, then by time distance from NOW
+        priority = _LIFECYCLE_PRIORITY.get(lifecycles[i], 99)
+        scheduled_time = times[i]
+        if scheduled_time is None:
             # If we can't parse time, put it at the end
-            time_diff = float('inf')
-        
-        # Return tuple: (priority, time_difference)
-        # This sorts by priority first, then by closest time to now
-        return (priority, time_diff)
+            return (priority, float('inf'))
+        # Calculate absolute time difference in seconds
+        return (priority, abs(scheduled_time - now))
     
-    streamable.sort(key=streamable_sort_key)
+    streamable_indices.sort(key=streamable_sort_key)
+    # Sort by scheduled time (most recent first); if no time, put at the end
+    def historical_sort_key(i: int) -> float:
+        scheduled_time = times[i]
+        return float('-inf') if scheduled_time is None else scheduled_time
     
-    # Sort historical broadcasts by scheduled time (most recent first)
-    def historical_sort_key(broadcast: LiveBroadcast) -> datetime:
-        try:
-            return parse_broadcast_time(broadcast)
-        except Exception:
-            # If no time, put at the end
-            return datetime.min.replace(tzinfo=pytz.UTC)
+    historical_indices.sort(key=historical_sort_key, reverse=True)
     
-    historical.sort(key=historical_sort_key, reverse=True)
+    streamable = [broadcasts[i] for i in streamable_indices]
+    historical = [broadcasts[i] for i in historical_indices]
     
     return (streamable, historical)